@@ -76,3 +76,30 @@ asyncio.get_event_loop().run_until_complete(
         ]
     )
 )
+
+
+# ----------------------------
+# reading from many things concurrently
+async def read_temperatures(
+    things: dict[str, ObjectProxy], max_concurrency: int = 50
+) -> dict[str, float | Exception]:
+    semaphore = asyncio.Semaphore(max_concurrency)
+
+    async def read(thing: ObjectProxy) -> float:
+        async with semaphore:
+            return await thing.async_read_property("temperature")
+
+    results = await asyncio.gather(
+        *[read(thing) for thing in things.values()], return_exceptions=True
+    )
+    return dict(zip(things.keys(), results))
+
+
+sensors = {
+    f"sensor-{i}": ClientFactory.zmq(
+        server_id="sensors", thing_id=f"sensor-{i}", access_point="IPC"
+    )
+    for i in range(200)
+}
+temperatures = asyncio.run(read_temperatures(sensors))
+failed = [name for name, value in temperatures.items() if isinstance(value, Exception)]